@@ -1,150 +1,189 @@
 # src/app/apis/companies_api/__init__.py
 
 # --- Start of Added Utilities ---
-import psycopg2
-import psycopg2.extras
+import asyncio
+import asyncpg
+import functools
 import databutton as db
-from contextlib import contextmanager
+import orjson
+from contextlib import asynccontextmanager
 import uuid
-import re
-from datetime import date, datetime
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import List, Optional
 
-@contextmanager
-def get_db_connection():
-    """Context manager for database connections."""
-    conn = None
-    db_url = db.secrets.get("POSTGRES_URL")
-    if not db_url:
-        print("ERROR: POSTGRES_URL secret not found.")
-        raise ValueError("Database connection URL not configured.")
+_POOL = None
+_POOL_LOCK = asyncio.Lock()
+
+async def get_db_pool():
+    """Return the shared asyncpg pool, creating it on first use."""
+    global _POOL
+    if _POOL is None:
+        async with _POOL_LOCK:
+            if _POOL is None:
+                db_url = db.secrets.get("POSTGRES_URL")
+                if not db_url:
+                    print("ERROR: POSTGRES_URL secret not found.")
+                    raise ValueError("Database connection URL not configured.")
+                # asyncpg's default statement cache prepares each distinct query text once per connection,
+                # so keep the hot queries' text constant (no per-request values in the SQL) to reuse the plan.
+                _POOL = await asyncpg.create_pool(
+                    db_url, min_size=10, max_size=50, max_inactive_connection_lifetime=300
+                )
+    return _POOL
+
+@asynccontextmanager
+async def get_db_connection(transaction=False):
+    """Async context manager yielding a pooled connection, optionally inside a transaction.
+    Without one, asyncpg runs each statement in autocommit mode, so single-statement writes
+    skip the BEGIN/COMMIT round-trips; only ask for a transaction when statements must be grouped."""
     try:
-        # print("Attempting to connect to PostgreSQL...") # Reduced logging noise
-        conn = psycopg2.connect(db_url)
-        # print("PostgreSQL connection successful.")
-        yield conn
+        pool = await get_db_pool()
+        async with pool.acquire() as conn:
+            if transaction:
+                async with conn.transaction():
+                    yield conn
+            else:
+                yield conn
+    except (HTTPException, asyncpg.PostgresError):
+        raise # Let endpoints report 404s and query errors themselves
     except Exception as e:
-        print(f"ERROR: PostgreSQL connection failed: {e}")
-        raise
-    finally:
-        if conn is not None:
-            conn.close()
-            # print("PostgreSQL connection closed.")
-
-@contextmanager
-def get_db_cursor(commit=False):
-    """Context manager for database cursors using RealDictCursor."""
-    conn_exception = None
-    try:
-        with get_db_connection() as conn:
-            cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-            try:
-                yield cursor
-                if commit:
-                    conn.commit()
-                    # print("DB transaction committed.")
-            finally:
-                cursor.close()
-    except Exception as e:
-        conn_exception = e # Capture exception
-
-    # Raise exception outside the context manager block if connection failed
-    if conn_exception:
-         print(f"ERROR: Database cursor operation failed: {conn_exception}")
-         # Raise a generic HTTPException for DB errors to be caught by FastAPI
-         raise HTTPException(status_code=500, detail="Database operation failed.")
-
-def snake_to_camel(snake_str):
-    """Convert snake_case string to camelCase."""
-    if not isinstance(snake_str, str): return snake_str
-    return re.sub(r'_([a-z0-9])', lambda match: match.group(1).upper(), snake_str)
-
-def row_to_camel_dict(row):
-    """Convert DB row (dict) from snake_case keys to camelCase keys for API."""
-    if row is None: return None
-    camel_dict = {}
-    for k, v in dict(row).items():
-        camel_key = snake_to_camel(k)
-        if isinstance(v, uuid.UUID): camel_dict[camel_key] = str(v)
-        elif isinstance(v, (datetime, date)): camel_dict[camel_key] = v.isoformat()
-        else: camel_dict[camel_key] = v
-    return camel_dict
-
-def camel_to_snake_dict(camel_dict):
-    """Convert API dict from camelCase keys to snake_case keys for DB."""
-    if camel_dict is None: return None
-    snake_dict = {}
-    for k, v in camel_dict.items():
-        snake_key = re.sub(r'(?<!^)(?=[A-Z])', '_', k).lower()
-        # Map specific UI fields to DB fields if names differ significantly
-        if k == 'location': # Map UI 'location' to DB 'address' or 'city' ? Let's use address for now
-            snake_key = 'address'
-        elif k == 'employees': # Map UI 'employees' to DB 'employee_estimate'
-             snake_key = 'employee_estimate'
-        # Add other mappings if needed
-
-        snake_dict[snake_key] = v
-    return snake_dict
+        print(f"ERROR: Database connection failed: {e}")
+        # Raise a generic HTTPException for DB errors to be caught by FastAPI
+        raise HTTPException(status_code=500, detail="Database operation failed.")
+
+# DB column -> API key for the columns selected by list_companies / get_company.
+# The SELECT/RETURNING lists alias each column to its API key, so rows arrive already in the response shape.
+_LIST_KEYMAP = {
+    'id': 'id', 'name': 'name', 'industry': 'industry', 'address': 'address',
+    'logo_url': 'logoUrl', 'employee_estimate': 'employeeEstimate',
+}
+_FULL_KEYMAP = {
+    **_LIST_KEYMAP,
+    'revenue': 'revenue', 'created_at': 'createdAt', 'updated_at': 'updatedAt',
+}
+
+def _aliased_columns(keymap):
+    """Build a SELECT list projecting each DB column under its API key."""
+    return ', '.join(col if col == key else f'{col} AS "{key}"' for col, key in keymap.items())
+
+# Column lists for the list/full models, shared by SELECTs and the RETURNING clause of writes
+_LIST_COLUMNS = _aliased_columns(_LIST_KEYMAP)
+_COMPANY_COLUMNS = _aliased_columns(_FULL_KEYMAP)
+
+# Columns present in the companies table (per user schema) that the API may write
+_ALLOWED_INSERT_COLS = frozenset({
+    'id', 'name', 'logo_url', 'city', 'foundation_date', 'domain', 'employee_range',
+    'categories', 'industry', 'address', 'contact_email', 'revenue', 'active',
+    'catchall_email_domain', 'cleaned_phone_number', 'additional_industries',
+    'alexa_rank', 'angel_list_profile_url', 'blog_url', 'business_industries',
+    'country_name', 'crunchbase_url', 'employee_estimate', 'facebook_profile_url',
+    'full_address', 'linkedin_id', 'linkedin_profile_url', 'main_domain',
+    'main_phone_cleaned_number', 'main_phone_number', 'main_phone_source',
+    'search_keywords', 'spoken_languages', 'state_name', 'stock_exchange',
+    'stock_symbol', 'store_count', 'twitter_profile_url', 'website_url',
+    'year_founded', 'zip_code', 'created_at', 'updated_at',
+})
+# id and created_at are fixed once a company exists
+_ALLOWED_UPDATE_COLS = _ALLOWED_INSERT_COLS - {'id', 'created_at'}
+
+# The write SQL only depends on which columns are present, so it is built once per column set.
+# Reusing the exact same text also lets asyncpg's statement cache hit across requests.
+# Callers must filter the columns against the allowed sets above first.
+@functools.lru_cache(maxsize=256)
+def _build_insert_sql(cols):
+    """Return (sql, ordered_cols) for inserting the given frozenset of columns."""
+    ordered_cols = tuple(sorted(cols))
+    values_placeholders = ', '.join(f"${i}" for i in range(1, len(ordered_cols) + 1))
+    sql = f"INSERT INTO companies ({', '.join(ordered_cols)}) VALUES ({values_placeholders}) RETURNING {_COMPANY_COLUMNS};"
+    return sql, ordered_cols
+
+@functools.lru_cache(maxsize=256)
+def _build_update_sql(cols):
+    """Return (sql, ordered_cols) for updating the given frozenset of columns; the id is the last parameter."""
+    ordered_cols = tuple(sorted(cols))
+    set_clause = ', '.join(f"{col} = ${i}" for i, col in enumerate(ordered_cols, start=1))
+    sql = f"UPDATE companies SET {set_clause} WHERE id = ${len(ordered_cols) + 1} RETURNING {_COMPANY_COLUMNS};"
+    return sql, ordered_cols
+
+def make_etag(*parts):
+    """Build a weak ETag from values that change whenever the response would."""
+    return 'W/"' + '-'.join(str(p) for p in parts) + '"'
+
+def etag_matches(request, etag):
+    """Check the request's If-None-Match header against an ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match: return False
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return etag in candidates or '*' in candidates
+
+def updated_at_etag(updated_at):
+    """ETag for a single company, derived from its updated_at (microsecond precision)."""
+    return make_etag(int(updated_at.timestamp() * 1_000_000))
 # --- End of Added Utilities ---
 
 
 # --- Updated Models ---
 # Define Company model based on actual DB columns needed by UI
-# Use Field(alias=...) if Pydantic model names differ from camelCase DB names
+# Field names match the API keys the queries alias the DB columns to (see _FULL_KEYMAP)
 class Company(BaseModel):
-    id: uuid.UUID # Keep as UUID, will be stringified by row_to_camel_dict
+    id: uuid.UUID # Keep as UUID, serialized to a string in the response
     name: str
     industry: Optional[str] = None
-    location: Optional[str] = Field(None, alias='address') # Map 'address' from DB to 'location' in API
-    logoUrl: Optional[str] = Field(None, alias='logoUrl') # DB is logo_url -> logoUrl
+    address: Optional[str] = None
+    logoUrl: Optional[str] = None # DB is logo_url
     revenue: Optional[int] = None # DB is bigint
-    employees: Optional[int] = Field(None, alias='employeeEstimate') # Map 'employeeEstimate' from DB
+    employeeEstimate: Optional[int] = None # DB is employee_estimate
     # Add other fields from your DB schema if needed by the UI later
-    # e.g., websiteUrl: Optional[str] = Field(None, alias='websiteUrl')
-    # city: Optional[str] = None
-    # countryName: Optional[str] = Field(None, alias='countryName')
+    # e.g., websiteUrl: Optional[str] = None (and add 'website_url' to _FULL_KEYMAP)
     createdAt: datetime # Keep as datetime, will be stringified
     updatedAt: datetime # Keep as datetime, will be stringified
 
-    class Config:
-        populate_by_name = True # Allow using alias for population
-
 # Model for listing companies (might be simpler)
 class CompanyListItem(BaseModel):
      id: uuid.UUID
      name: str
      industry: Optional[str] = None
-     location: Optional[str] = Field(None, alias='address')
-     logoUrl: Optional[str] = Field(None, alias='logoUrl')
+     address: Optional[str] = None
+     logoUrl: Optional[str] = None
      # Add employees/revenue if shown in list/grid view
-     employees: Optional[int] = Field(None, alias='employeeEstimate')
-
-     class Config:
-        populate_by_name = True
+     employeeEstimate: Optional[int] = None
 
-# Request model for creating (maps UI fields to potential DB fields)
+# Request model for creating. Fields are named after the DB columns and aliased to the UI's names,
+# so model_dump() already yields the columns to write.
 class CreateCompanyRequest(BaseModel):
-    name: str # Maps to db 'name'
-    industry: str # Maps to db 'industry'
-    location: str # Maps to db 'address'
-    logoUrl: Optional[str] = None # Maps to db 'logo_url'
-    revenue: Optional[int] = None # Maps to db 'revenue'
-    employees: Optional[int] = None # Maps to db 'employee_estimate'
+    model_config = ConfigDict(populate_by_name=True)
+
+    name: str
+    industry: str
+    address: str = Field(..., alias='location')
+    logo_url: Optional[str] = Field(None, alias='logoUrl')
+    revenue: Optional[int] = None
+    employee_estimate: Optional[int] = Field(None, alias='employees')
 
 # Request model for updating (all optional)
 class UpdateCompanyRequest(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
     name: Optional[str] = None
     industry: Optional[str] = None
-    location: Optional[str] = None # Will map to 'address' in DB via helper
-    logoUrl: Optional[str] = None
+    address: Optional[str] = Field(None, alias='location')
+    logo_url: Optional[str] = Field(None, alias='logoUrl')
     revenue: Optional[int] = None
-    employees: Optional[int] = None # Will map to 'employee_estimate' in DB via helper
+    employee_estimate: Optional[int] = Field(None, alias='employees')
 
 # Response models (can use the main Company model or specific ones)
+# Keyset position to pass back as the afterName/afterId query parameters to fetch the next page
+class ListCompaniesCursor(BaseModel):
+    afterName: str
+    afterId: uuid.UUID
+
 class ListCompaniesResponse(BaseModel):
     companies: List[CompanyListItem]
+    nextCursor: Optional[ListCompaniesCursor] = None # None on the last page
 
 class GetCompanyResponse(BaseModel):
     company: Company
@@ -152,8 +191,23 @@ class GetCompanyResponse(BaseModel):
 class UpsertCompanyResponse(BaseModel):
     company: Company
 
+class BulkCreateCompaniesResponse(BaseModel):
+    companies: List[Company]
+
+# Validates a whole list of companies in one pydantic-core call instead of one model_validate per row
+_COMPANY_LIST_ADAPTER = TypeAdapter(List[Company])
+
 # --- API Router ---
-router = APIRouter(prefix="/companies", tags=["Companies"])
+# orjson encodes the response payloads (UUIDs, datetimes included) much faster than the stdlib json
+router = APIRouter(prefix="/companies", tags=["Companies"], default_response_class=ORJSONResponse)
+
+@router.on_event("shutdown")
+async def close_db_pool():
+    """Close all pooled connections when the app shuts down."""
+    global _POOL
+    if _POOL is not None:
+        await _POOL.close()
+        _POOL = None
 
 # --- (Endpoints will be added/modified in the next step) ---
 
@@ -164,84 +218,203 @@ router = APIRouter(prefix="/companies", tags=["Companies"])
 # --- API Endpoints ---
 
 @router.get("", response_model=ListCompaniesResponse)
-def list_companies() -> ListCompaniesResponse:
+async def list_companies(
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    after_name: Optional[str] = Query(None, alias="afterName"),
+    after_id: Optional[uuid.UUID] = Query(None, alias="afterId"),
+) -> ListCompaniesResponse:
     """
-    Retrieves a list of companies from the database.
+    Retrieves a page of companies from the database, ordered by name.
     Fetches fields relevant for the list/grid view.
+    Pass the previous response's nextCursor fields (afterName/afterId) as query parameters to get the next page.
+    Responds 304 Not Modified when If-None-Match matches the current companies_version ETag.
     """
-    print("API: Fetching list of companies from database")
-    # Select fields relevant for CompanyListItem
-    query = """
-        SELECT id, name, industry, address, logo_url, employee_estimate
-        FROM companies
-        ORDER BY name ASC;
-    """
+    print(f"API: Fetching up to {limit} companies from database")
+    if (after_name is None) != (after_id is None):
+        raise HTTPException(status_code=400, detail="afterName and afterId must be provided together.")
+    # Select fields relevant for CompanyListItem. One row past the page tells us whether another page exists.
+    # The first page and later pages use separate constant queries so each keeps its own cached plan.
+    # Both are served by the companies_name_id_idx index on (name, id) (migrations/0001_companies_name_id_idx.sql);
+    # don't drop it or change the ORDER BY without updating the index.
+    if after_name is None:
+        query = f"""
+            SELECT {_LIST_COLUMNS}
+            FROM companies
+            ORDER BY name, id
+            LIMIT $1;
+        """
+        args = (limit + 1,)
+    else:
+        query = f"""
+            SELECT {_LIST_COLUMNS}
+            FROM companies
+            WHERE (name, id) > ($1, $2)
+            ORDER BY name, id
+            LIMIT $3;
+        """
+        args = (after_name, after_id, limit + 1)
     companies_list = []
+    next_cursor = None
     try:
-        with get_db_cursor() as cursor:
-            cursor.execute(query)
-            results = cursor.fetchall()
+        async with get_db_connection() as conn:
+            # Cheap probe first: companies_version holds a few counters bumped by triggers on every write to
+            # companies (migrations/0002_companies_version.sql). It is read before the page, so a write
+            # landing in between only makes the ETag older than the page, never newer.
+            try:
+                version = await conn.fetchval("SELECT sum(version)::bigint FROM companies_version;")
+            except asyncpg.UndefinedTableError:
+                version = None # Migration not applied yet: serve the page without an ETag
+            if version is not None:
+                etag = make_etag(version)
+                if etag_matches(request, etag):
+                    print("API: Company list unchanged, returning 304")
+                    return Response(status_code=304, headers={"ETag": etag})
+                response.headers["ETag"] = etag
+
+            results = await conn.fetch(query, *args)
             print(f"API: Found {len(results)} companies in DB.")
-            # Convert each row using the alias-aware CompanyListItem model
-            for row in results:
-                 # Explicitly map DB columns to CompanyListItem fields using aliases
-                 company_data = row_to_camel_dict(row)
-                 # Validate and append (Pydantic handles alias mapping here)
-                 companies_list.append(CompanyListItem.model_validate(company_data))
+            if len(results) > limit:
+                results = results[:limit]
+                last_row = results[-1]
+                next_cursor = ListCompaniesCursor(afterName=last_row['name'], afterId=last_row['id'])
+            # Rows come straight from our own table (already keyed by field name), so build the items
+            # without re-validating them
+            companies_list = [
+                CompanyListItem.model_construct(**row)
+                for row in results
+            ]
 
     except HTTPException as http_exc:
-        raise http_exc # Re-raise HTTP exceptions from cursor context manager
+        raise http_exc # Re-raise HTTP exceptions from connection context manager
     except Exception as e:
         print(f"API ERROR: Failed to fetch companies: {e}")
-        # Consider raising HTTPException here too, or let the cursor manager handle it
+        # Consider raising HTTPException here too, or let the connection manager handle it
         raise HTTPException(status_code=500, detail="Failed to retrieve companies from database.")
 
-    return ListCompaniesResponse(companies=companies_list)
+    return ListCompaniesResponse.model_construct(companies=companies_list, nextCursor=next_cursor)
+
+
+# Rows fetched from the server-side cursor (and written to the response) per batch
+_EXPORT_BATCH_SIZE = 2000
+
+async def _release_export_connection(export):
+    """
+    End the export's read-only transaction (if started) and hand its connection back to the pool.
+    Safe to call more than once: the first call takes the connection out of `export`, later calls do nothing.
+    """
+    conn = export.pop("conn", None)
+    if conn is None: return
+    transaction = export.pop("transaction", None)
+    try:
+        if transaction is not None:
+            await transaction.rollback() # Nothing was written; rollback just closes the cursor's transaction
+    except Exception as e:
+        print(f"ERROR: Failed to end export transaction: {e}") # The pool resets the connection on release
+    finally:
+        await export["pool"].release(conn)
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_companies() -> StreamingResponse:
+    """
+    Streams every company as newline-delimited JSON.
+    Rows are read through a server-side cursor, so memory stays bounded regardless of table size.
+    """
+    print("API: Streaming company export from database")
+    query = f"""
+        SELECT {_COMPANY_COLUMNS}
+        FROM companies
+        ORDER BY name, id;
+    """
+
+    # Acquire the connection, open the transaction (asyncpg cursors only exist inside one) and read the
+    # first batch before returning: once the StreamingResponse starts, the 200 status is already sent
+    # and a failure could only truncate the body.
+    export = {}
+    try:
+        export["pool"] = await get_db_pool()
+        conn = export["conn"] = await export["pool"].acquire()
+        transaction = conn.transaction()
+        await transaction.start()
+        export["transaction"] = transaction
+        cursor = await conn.cursor(query)
+        first_batch = await cursor.fetch(_EXPORT_BATCH_SIZE)
+    except Exception as e:
+        print(f"API ERROR: Failed to start company export: {e}")
+        await _release_export_connection(export)
+        raise HTTPException(status_code=500, detail="Failed to export companies from database.")
+
+    async def stream_rows():
+        try:
+            batch = first_batch
+            while batch:
+                yield b"".join(orjson.dumps(dict(row)) + b"\n" for row in batch)
+                batch = await cursor.fetch(_EXPORT_BATCH_SIZE)
+        finally:
+            await _release_export_connection(export) # Frees the connection as soon as a failed stream unwinds
+
+    # If the client disconnects before the first chunk, Starlette cancels the response without ever starting
+    # stream_rows, so its finally never runs; the background task is awaited on that path (and after a normal
+    # finish, where it is a no-op). A stream that raises skips background tasks, which the finally above covers.
+    return StreamingResponse(
+        stream_rows(),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(_release_export_connection, export),
+    )
 
 
 @router.get("/{company_id}", response_model=GetCompanyResponse)
-def get_company(company_id: uuid.UUID) -> GetCompanyResponse:
+async def get_company(company_id: uuid.UUID, request: Request, response: Response) -> GetCompanyResponse:
     """
     Retrieves details for a specific company by its UUID from the database.
+    Responds 304 Not Modified when If-None-Match matches the company's current ETag.
     """
     print(f"API: Fetching company with ID: {company_id} from database")
     # Select all relevant fields for the Company model
-    query = """
-        SELECT id, name, industry, address, logo_url, revenue, employee_estimate, created_at, updated_at
+    query = f"""
+        SELECT {_COMPANY_COLUMNS}
         FROM companies
-        WHERE id = %s;
+        WHERE id = $1;
     """
     try:
-        with get_db_cursor() as cursor:
-            cursor.execute(query, (str(company_id),)) # Pass ID as tuple
-            result = cursor.fetchone()
+        async with get_db_connection() as conn:
+            if request.headers.get("if-none-match"):
+                # Revalidation: probe the timestamp before paying for the full row
+                updated_at = await conn.fetchval("SELECT updated_at FROM companies WHERE id = $1;", company_id)
+                if updated_at is not None and etag_matches(request, updated_at_etag(updated_at)):
+                    print(f"API: Company {company_id} unchanged, returning 304")
+                    return Response(status_code=304, headers={"ETag": updated_at_etag(updated_at)})
+
+            result = await conn.fetchrow(query, company_id)
             if result is None:
                 print(f"API: Company with ID {company_id} not found in DB")
                 raise HTTPException(status_code=404, detail="Company not found")
 
-            # Convert row using the alias-aware Company model
-            company_data = row_to_camel_dict(result)
+            # Row keys already match the Company fields
+            company_data = dict(result)
             validated_company = Company.model_validate(company_data)
+            response.headers["ETag"] = updated_at_etag(validated_company.updatedAt)
             print(f"API: Found company: {validated_company.name}")
             return GetCompanyResponse(company=validated_company)
 
     except HTTPException as http_exc:
-        raise http_exc # Re-raise HTTP exceptions (404 or 500 from cursor)
+        raise http_exc # Re-raise HTTP exceptions (404 or 500 from connection)
     except Exception as e:
         print(f"API ERROR: Failed to fetch company {company_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve company details from database.")
 
 
 @router.post("", response_model=UpsertCompanyResponse, status_code=201)
-def create_company(request: CreateCompanyRequest) -> UpsertCompanyResponse:
+async def create_company(request: CreateCompanyRequest) -> UpsertCompanyResponse:
     """
     Creates a new company entry in the database.
     Generates a new UUID for the company.
     """
     print(f"API: Attempting to create company: {request.name}")
     new_id = uuid.uuid4()
-    # Convert request (camelCase) to snake_case for DB insertion
-    company_data_snake = camel_to_snake_dict(request.model_dump(exclude_unset=True))
+    # Request fields are named after the DB columns
+    company_data_snake = request.model_dump(exclude_unset=True)
 
     # Add required fields not in request (id, timestamps)
     company_data_snake['id'] = new_id
@@ -250,21 +423,8 @@ def create_company(request: CreateCompanyRequest) -> UpsertCompanyResponse:
     company_data_snake['created_at'] = now
     company_data_snake['updated_at'] = now
 
-    # Filter only columns present in the DB table based on user schema
-    allowed_columns = [
-        'id', 'name', 'logo_url', 'city', 'foundation_date', 'domain', 'employee_range',
-        'categories', 'industry', 'address', 'contact_email', 'revenue', 'active',
-        'catchall_email_domain', 'cleaned_phone_number', 'additional_industries',
-        'alexa_rank', 'angel_list_profile_url', 'blog_url', 'business_industries',
-        'country_name', 'crunchbase_url', 'employee_estimate', 'facebook_profile_url',
-        'full_address', 'linkedin_id', 'linkedin_profile_url', 'main_domain',
-        'main_phone_cleaned_number', 'main_phone_number', 'main_phone_source',
-        'search_keywords', 'spoken_languages', 'state_name', 'stock_exchange',
-        'stock_symbol', 'store_count', 'twitter_profile_url', 'website_url',
-        'year_founded', 'zip_code', 'created_at', 'updated_at'
-    ]
     # Filter the dict to only include keys that are allowed columns and have non-None values
-    insert_data = {k: v for k, v in company_data_snake.items() if k in allowed_columns and v is not None}
+    insert_data = {k: v for k, v in company_data_snake.items() if k in _ALLOWED_INSERT_COLS and v is not None}
 
     # Ensure essential columns have values if not provided and nullable
     if 'name' not in insert_data:
@@ -274,30 +434,24 @@ def create_company(request: CreateCompanyRequest) -> UpsertCompanyResponse:
     if 'updated_at' not in insert_data: insert_data['updated_at'] = now
 
 
-    # Construct dynamic INSERT query
-    columns = insert_data.keys()
-    values_placeholders = ', '.join(['%s'] * len(columns))
-    columns_str = ', '.join(columns)
-    query = f"INSERT INTO companies ({columns_str}) VALUES ({values_placeholders}) RETURNING id;"
-
+    # Look up the INSERT query for this set of columns
+    query, columns = _build_insert_sql(frozenset(insert_data))
     values = [insert_data[col] for col in columns] # Ensure order matches columns
 
     try:
-        with get_db_cursor(commit=True) as cursor:
+        async with get_db_connection() as conn:
             print(f"Executing INSERT: {query} with values: {values}")
-            cursor.execute(query, values)
-            inserted_row = cursor.fetchone() # Fetch the returned id
+            inserted_row = await conn.fetchrow(query, *values) # Fetch the created company
             if not inserted_row:
-                raise HTTPException(status_code=500, detail="Failed to retrieve created company ID.")
-            inserted_id = inserted_row['id']
+                raise HTTPException(status_code=500, detail="Failed to retrieve created company.")
 
-            print(f"API: Successfully created company with ID {inserted_id}")
-            # Fetch the newly created company to return it
-            return get_company(inserted_id) # Reuse get_company endpoint logic
+        print(f"API: Successfully created company with ID {inserted_row['id']}")
+        # Build the response from the RETURNING row instead of a second SELECT
+        return UpsertCompanyResponse(company=Company.model_validate(dict(inserted_row)))
 
     except HTTPException as http_exc:
         raise http_exc
-    except psycopg2.Error as db_err: # Catch specific DB errors
+    except asyncpg.PostgresError as db_err: # Catch specific DB errors
         print(f"API DB ERROR (Create): {db_err}")
         raise HTTPException(status_code=500, detail=f"Database error during company creation: {db_err}")
     except Exception as e:
@@ -305,14 +459,81 @@ def create_company(request: CreateCompanyRequest) -> UpsertCompanyResponse:
         raise HTTPException(status_code=500, detail="Failed to create company in database.")
 
 
+# Largest batch bulk_create_companies accepts; bigger imports should be split client-side
+_BULK_CREATE_MAX_COMPANIES = 1000
+
+@router.post(
+    "/bulk",
+    response_model=BulkCreateCompaniesResponse,
+    status_code=201,
+    responses={413: {"description": f"More than {_BULK_CREATE_MAX_COMPANIES} companies in one request"}},
+)
+async def bulk_create_companies(requests: List[CreateCompanyRequest]) -> BulkCreateCompaniesResponse:
+    """
+    Creates up to 1000 company entries using COPY, in a single transaction.
+    Each company is stored exactly as create_company would store it: omitted optional fields are
+    left out of the insert, so column defaults apply.
+    """
+    print(f"API: Attempting to bulk create {len(requests)} companies")
+    if not requests:
+        raise HTTPException(status_code=400, detail="No companies provided.")
+    if len(requests) > _BULK_CREATE_MAX_COMPANIES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {_BULK_CREATE_MAX_COMPANIES} companies can be created per request.",
+        )
+
+    now = datetime.now()
+    new_ids = []
+    # COPY needs one column list per statement, so group the records by the set of columns they provide
+    records_by_columns = {}
+    for request in requests:
+        company_data_snake = request.model_dump(exclude_unset=True)
+        company_data_snake['id'] = uuid.uuid4()
+        company_data_snake['created_at'] = now
+        company_data_snake['updated_at'] = now
+        # Same filtering as create_company, so None/unset fields fall back to the column defaults
+        insert_data = {k: v for k, v in company_data_snake.items() if k in _ALLOWED_INSERT_COLS and v is not None}
+        columns = tuple(sorted(insert_data))
+        records_by_columns.setdefault(columns, []).append(tuple(insert_data[col] for col in columns))
+        new_ids.append(insert_data['id'])
+
+    query = f"""
+        SELECT {_COMPANY_COLUMNS}
+        FROM companies
+        WHERE id = ANY($1::uuid[]);
+    """
+    try:
+        # Several COPYs (one per column set) must succeed or fail together
+        async with get_db_connection(transaction=True) as conn:
+            for columns, records in records_by_columns.items():
+                await conn.copy_records_to_table('companies', records=records, columns=list(columns))
+            # COPY has no RETURNING; read the rows back so defaults filled in by the DB are included
+            rows = await conn.fetch(query, new_ids)
+
+        print(f"API: Successfully bulk created {len(new_ids)} companies")
+        rows_by_id = {row['id']: row for row in rows}
+        companies = _COMPANY_LIST_ADAPTER.validate_python([dict(rows_by_id[new_id]) for new_id in new_ids])
+        return BulkCreateCompaniesResponse.model_construct(companies=companies)
+
+    except HTTPException as http_exc:
+        raise http_exc
+    except asyncpg.PostgresError as db_err: # Catch specific DB errors
+        print(f"API DB ERROR (Bulk create): {db_err}")
+        raise HTTPException(status_code=500, detail=f"Database error during bulk company creation: {db_err}")
+    except Exception as e:
+        print(f"API ERROR: Failed to bulk create companies: {e}")
+        raise HTTPException(status_code=500, detail="Failed to create companies in database.")
+
+
 @router.put("/{company_id}", response_model=UpsertCompanyResponse)
-def update_company(company_id: uuid.UUID, request: UpdateCompanyRequest) -> UpsertCompanyResponse:
+async def update_company(company_id: uuid.UUID, request: UpdateCompanyRequest) -> UpsertCompanyResponse:
     """
     Updates an existing company entry in the database by its UUID.
     """
     print(f"API: Attempting to update company with ID: {company_id}")
-    # Convert request (camelCase) to snake_case
-    update_data_snake = camel_to_snake_dict(request.model_dump(exclude_unset=True))
+    # Request fields are named after the DB columns
+    update_data_snake = request.model_dump(exclude_unset=True)
 
     if not update_data_snake:
         raise HTTPException(status_code=400, detail="No update data provided.")
@@ -320,49 +541,32 @@ def update_company(company_id: uuid.UUID, request: UpdateCompanyRequest) -> Upse
     # Add updated_at timestamp
     update_data_snake['updated_at'] = datetime.now()
 
-    # Filter only columns present in the DB table that can be updated
-    allowed_update_columns = [
-        'name', 'logo_url', 'city', 'foundation_date', 'domain', 'employee_range',
-        'categories', 'industry', 'address', 'contact_email', 'revenue', 'active',
-        'catchall_email_domain', 'cleaned_phone_number', 'additional_industries',
-        'alexa_rank', 'angel_list_profile_url', 'blog_url', 'business_industries',
-        'country_name', 'crunchbase_url', 'employee_estimate', 'facebook_profile_url',
-        'full_address', 'linkedin_id', 'linkedin_profile_url', 'main_domain',
-        'main_phone_cleaned_number', 'main_phone_number', 'main_phone_source',
-        'search_keywords', 'spoken_languages', 'state_name', 'stock_exchange',
-        'stock_symbol', 'store_count', 'twitter_profile_url', 'website_url',
-        'year_founded', 'zip_code', 'updated_at' # Include updated_at
-    ]
     # Filter to allowed columns and non-None values
-    update_fields = {k: v for k, v in update_data_snake.items() if k in allowed_update_columns and v is not None}
+    update_fields = {k: v for k, v in update_data_snake.items() if k in _ALLOWED_UPDATE_COLS and v is not None}
 
     # Check if only 'updated_at' is present or if dict is empty after filtering Nones
     if not update_fields or all(k == 'updated_at' for k in update_fields):
          raise HTTPException(status_code=400, detail="No valid fields provided for update.")
 
-    # Construct dynamic UPDATE query
-    set_clause = ', '.join([f"{col} = %s" for col in update_fields.keys()])
-    query = f"UPDATE companies SET {set_clause} WHERE id = %s RETURNING id;"
-
-    values = list(update_fields.values()) + [str(company_id)] # Values for SET clause + WHERE clause
+    # Look up the UPDATE query for this set of columns
+    query, columns = _build_update_sql(frozenset(update_fields))
+    values = [update_fields[col] for col in columns] + [company_id] # Values for SET clause + WHERE clause
 
     try:
-        with get_db_cursor(commit=True) as cursor:
-            print(f"Executing UPDATE for ID {company_id} with fields: {list(update_fields.keys())}")
-            cursor.execute(query, values)
-            result = cursor.fetchone()
+        async with get_db_connection() as conn:
+            print(f"Executing UPDATE for ID {company_id} with fields: {list(columns)}")
+            result = await conn.fetchrow(query, *values)
             if result is None:
                  print(f"API: Company with ID {company_id} not found for update.")
                  raise HTTPException(status_code=404, detail="Company not found")
 
-            updated_id = result['id']
-            print(f"API: Successfully updated company with ID {updated_id}")
-            # Fetch the updated company to return it
-            return get_company(updated_id)
+        print(f"API: Successfully updated company with ID {result['id']}")
+        # Build the response from the RETURNING row instead of a second SELECT
+        return UpsertCompanyResponse(company=Company.model_validate(dict(result)))
 
     except HTTPException as http_exc:
         raise http_exc
-    except psycopg2.Error as db_err: # Catch specific DB errors
+    except asyncpg.PostgresError as db_err: # Catch specific DB errors
         print(f"API DB ERROR (Update): {db_err}")
         raise HTTPException(status_code=500, detail=f"Database error during company update: {db_err}")
     except Exception as e:
@@ -371,18 +575,17 @@ def update_company(company_id: uuid.UUID, request: UpdateCompanyRequest) -> Upse
 
 
 @router.delete("/{company_id}", status_code=204)
-def delete_company(company_id: uuid.UUID):
+async def delete_company(company_id: uuid.UUID):
     """
     Deletes a company entry from the database by its UUID.
     Returns No Content (204) on success.
     """
     print(f"API: Attempting to delete company with ID: {company_id}")
-    query = "DELETE FROM companies WHERE id = %s RETURNING id;"
+    query = "DELETE FROM companies WHERE id = $1 RETURNING id;"
 
     try:
-        with get_db_cursor(commit=True) as cursor:
-            cursor.execute(query, (str(company_id),))
-            result = cursor.fetchone()
+        async with get_db_connection() as conn:
+            result = await conn.fetchrow(query, company_id)
             if result is None:
                 print(f"API: Company with ID {company_id} not found for deletion")
                 raise HTTPException(status_code=404, detail="Company not found")
@@ -394,7 +597,7 @@ def delete_company(company_id: uuid.UUID):
 
     except HTTPException as http_exc:
         raise http_exc # Re-raise 404 or 500
-    except psycopg2.Error as db_err: # Catch specific DB errors
+    except asyncpg.PostgresError as db_err: # Catch specific DB errors
         print(f"API DB ERROR (Delete): {db_err}")
         raise HTTPException(status_code=500, detail=f"Database error during company deletion: {db_err}")
     except Exception as e:
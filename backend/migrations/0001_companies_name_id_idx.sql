@@ -0,0 +1,16 @@
+-- Index backing list_companies' ORDER BY name, id and its (name, id) keyset pagination,
+-- so each page is an index range scan instead of a sort over the whole table.
+--
+-- Nothing in the app runs these migrations. Apply each file in filename order with psql against the
+-- database in the app's POSTGRES_URL secret before deploying code that needs it, e.g.:
+--   psql "$POSTGRES_URL" -v ON_ERROR_STOP=1 -f 0001_companies_name_id_idx.sql
+-- Don't wrap this file in a transaction (no psql -1/--single-transaction): CONCURRENTLY avoids
+-- locking writes but cannot run inside a transaction block. Re-running it is a no-op once the index exists.
+--
+-- A failed or cancelled CREATE INDEX CONCURRENTLY leaves an INVALID index behind, which IF NOT EXISTS
+-- then skips. If the build was interrupted, check it and only rebuild when it is invalid:
+--   SELECT indisvalid FROM pg_index WHERE indexrelid = 'companies_name_id_idx'::regclass;
+--   -- if that returns false:
+--   DROP INDEX CONCURRENTLY companies_name_id_idx;
+--   -- then re-run this file.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS companies_name_id_idx ON companies (name, id);
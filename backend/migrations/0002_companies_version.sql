@@ -0,0 +1,55 @@
+-- Change marker for list_companies' ETag: statement-level triggers bump a counter on every insert,
+-- update, delete or truncate of companies that touches at least one row, and the endpoint reads
+-- sum(version) over this tiny table instead of scanning companies.
+--
+-- The counter is split across 16 shard rows picked by backend pid, so concurrent writers usually
+-- update different rows instead of all queuing on one row lock. Writers that land on the same shard
+-- still serialize on it until commit (bulk_create_companies holds its shard across its COPYs and
+-- read-back); that is the cost of a transactional marker. Counters only grow, so the sum changes
+-- whenever any write commits.
+-- Apply after 0001 the same way (see the header of 0001_companies_name_id_idx.sql); it is safe to re-run.
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS companies_version (
+    shard smallint PRIMARY KEY,
+    version bigint NOT NULL DEFAULT 0
+);
+-- Keep the shard count in step with the modulus in bump_companies_version()
+INSERT INTO companies_version (shard) SELECT generate_series(0, 15) ON CONFLICT (shard) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_companies_version() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    -- Statements that matched no rows (e.g. an UPDATE or DELETE of a missing id) leave the ETag alone.
+    -- TRUNCATE has no transition table, so only the other events check it.
+    IF TG_OP <> 'TRUNCATE' THEN
+        IF NOT EXISTS (SELECT 1 FROM changed_rows) THEN
+            RETURN NULL;
+        END IF;
+    END IF;
+    UPDATE companies_version SET version = version + 1 WHERE shard = pg_backend_pid() % 16;
+    RETURN NULL;
+END;
+$$;
+
+-- One trigger per event: a trigger with transition tables may only fire on a single event.
+-- FOR EACH STATEMENT: a bulk COPY or multi-row update bumps the counter once, not once per row.
+DROP TRIGGER IF EXISTS companies_version_bump ON companies;
+DROP TRIGGER IF EXISTS companies_version_bump_insert ON companies;
+CREATE TRIGGER companies_version_bump_insert
+    AFTER INSERT ON companies REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_companies_version();
+DROP TRIGGER IF EXISTS companies_version_bump_update ON companies;
+CREATE TRIGGER companies_version_bump_update
+    AFTER UPDATE ON companies REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_companies_version();
+DROP TRIGGER IF EXISTS companies_version_bump_delete ON companies;
+CREATE TRIGGER companies_version_bump_delete
+    AFTER DELETE ON companies REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_companies_version();
+DROP TRIGGER IF EXISTS companies_version_bump_truncate ON companies;
+CREATE TRIGGER companies_version_bump_truncate
+    AFTER TRUNCATE ON companies
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_companies_version();
+
+COMMIT;
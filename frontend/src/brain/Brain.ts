@@ -1,4 +1,6 @@
 import {
+  BulkCreateCompaniesData,
+  BulkCreateCompaniesError,
   CheckHealthData,
   CreateCompanyData,
   CreateCompanyError,
@@ -6,10 +8,13 @@ import {
   DeleteCompanyData,
   DeleteCompanyError,
   DeleteCompanyParams,
+  ExportCompaniesData,
   GetCompanyData,
   GetCompanyError,
   GetCompanyParams,
   ListCompaniesData,
+  ListCompaniesError,
+  ListCompaniesParams,
   UpdateCompanyData,
   UpdateCompanyError,
   UpdateCompanyParams,
@@ -33,17 +38,18 @@ export class Brain<SecurityDataType = unknown> extends HttpClient<SecurityDataTy
     });
 
   /**
-   * @description Retrieves a list of companies from the database. Fetches fields relevant for the list/grid view.
+   * @description Retrieves a page of companies from the database, ordered by name. Fetches fields relevant for the list/grid view. Pass the previous response's nextCursor fields (afterName/afterId) as query parameters to get the next page. Responds 304 Not Modified when If-None-Match matches the current companies_version ETag.
    *
    * @tags Companies, dbtn/module:companies_api
    * @name list_companies
    * @summary List Companies
    * @request GET:/routes/companies
    */
-  list_companies = (params: RequestParams = {}) =>
-    this.request<ListCompaniesData, any>({
+  list_companies = (query: ListCompaniesParams, params: RequestParams = {}) =>
+    this.request<ListCompaniesData, ListCompaniesError>({
       path: `/routes/companies`,
       method: "GET",
+      query: query,
       ...params,
     });
 
@@ -65,7 +71,22 @@ export class Brain<SecurityDataType = unknown> extends HttpClient<SecurityDataTy
     });
 
   /**
-   * @description Retrieves details for a specific company by its UUID from the database.
+   * @description Streams every company as newline-delimited JSON. Rows are read through a server-side cursor, so memory stays bounded regardless of table size.
+   *
+   * @tags Companies, dbtn/module:companies_api
+   * @name export_companies
+   * @summary Export Companies
+   * @request GET:/routes/companies/export
+   */
+  export_companies = (params: RequestParams = {}) =>
+    this.request<ExportCompaniesData, any>({
+      path: `/routes/companies/export`,
+      method: "GET",
+      ...params,
+    });
+
+  /**
+   * @description Retrieves details for a specific company by its UUID from the database. Responds 304 Not Modified when If-None-Match matches the company's current ETag.
    *
    * @tags Companies, dbtn/module:companies_api
    * @name get_company
@@ -114,4 +135,21 @@ export class Brain<SecurityDataType = unknown> extends HttpClient<SecurityDataTy
       method: "DELETE",
       ...params,
     });
+
+  /**
+   * @description Creates up to 1000 company entries using COPY, in a single transaction. Each company is stored exactly as create_company would store it: omitted optional fields are left out of the insert, so column defaults apply.
+   *
+   * @tags Companies, dbtn/module:companies_api
+   * @name bulk_create_companies
+   * @summary Bulk Create Companies
+   * @request POST:/routes/companies/bulk
+   */
+  bulk_create_companies = (data: CreateCompanyRequest[], params: RequestParams = {}) =>
+    this.request<BulkCreateCompaniesData, BulkCreateCompaniesError>({
+      path: `/routes/companies/bulk`,
+      method: "POST",
+      body: data,
+      type: ContentType.Json,
+      ...params,
+    });
 }
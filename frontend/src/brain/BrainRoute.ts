@@ -1,8 +1,10 @@
 import {
+  BulkCreateCompaniesData,
   CheckHealthData,
   CreateCompanyData,
   CreateCompanyRequest,
   DeleteCompanyData,
+  ExportCompaniesData,
   GetCompanyData,
   ListCompaniesData,
   UpdateCompanyData,
@@ -25,7 +27,7 @@ export namespace Brain {
   }
 
   /**
-   * @description Retrieves a list of companies from the database. Fetches fields relevant for the list/grid view.
+   * @description Retrieves a page of companies from the database, ordered by name. Fetches fields relevant for the list/grid view. Pass the previous response's nextCursor fields (afterName/afterId) as query parameters to get the next page. Responds 304 Not Modified when If-None-Match matches the current companies_version ETag.
    * @tags Companies, dbtn/module:companies_api
    * @name list_companies
    * @summary List Companies
@@ -33,7 +35,19 @@ export namespace Brain {
    */
   export namespace list_companies {
     export type RequestParams = {};
-    export type RequestQuery = {};
+    export type RequestQuery = {
+      /**
+       * Limit
+       * @min 1
+       * @max 500
+       * @default 50
+       */
+      limit?: number;
+      /** Aftername */
+      afterName?: string | null;
+      /** Afterid */
+      afterId?: string | null;
+    };
     export type RequestBody = never;
     export type RequestHeaders = {};
     export type ResponseBody = ListCompaniesData;
@@ -55,7 +69,22 @@ export namespace Brain {
   }
 
   /**
-   * @description Retrieves details for a specific company by its UUID from the database.
+   * @description Streams every company as newline-delimited JSON. Rows are read through a server-side cursor, so memory stays bounded regardless of table size.
+   * @tags Companies, dbtn/module:companies_api
+   * @name export_companies
+   * @summary Export Companies
+   * @request GET:/routes/companies/export
+   */
+  export namespace export_companies {
+    export type RequestParams = {};
+    export type RequestQuery = {};
+    export type RequestBody = never;
+    export type RequestHeaders = {};
+    export type ResponseBody = ExportCompaniesData;
+  }
+
+  /**
+   * @description Retrieves details for a specific company by its UUID from the database. Responds 304 Not Modified when If-None-Match matches the company's current ETag.
    * @tags Companies, dbtn/module:companies_api
    * @name get_company
    * @summary Get Company
@@ -116,4 +145,19 @@ export namespace Brain {
     export type RequestHeaders = {};
     export type ResponseBody = DeleteCompanyData;
   }
+
+  /**
+   * @description Creates up to 1000 company entries using COPY, in a single transaction. Each company is stored exactly as create_company would store it: omitted optional fields are left out of the insert, so column defaults apply.
+   * @tags Companies, dbtn/module:companies_api
+   * @name bulk_create_companies
+   * @summary Bulk Create Companies
+   * @request POST:/routes/companies/bulk
+   */
+  export namespace bulk_create_companies {
+    export type RequestParams = {};
+    export type RequestQuery = {};
+    export type RequestBody = CreateCompanyRequest[];
+    export type RequestHeaders = {};
+    export type ResponseBody = BulkCreateCompaniesData;
+  }
 }
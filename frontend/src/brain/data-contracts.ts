@@ -1,3 +1,9 @@
+/** BulkCreateCompaniesResponse */
+export interface BulkCreateCompaniesResponse {
+  /** Companies */
+  companies: Company[];
+}
+
 /** Company */
 export interface Company {
   /**
@@ -81,10 +87,22 @@ export interface HealthResponse {
   status: string;
 }
 
+/** ListCompaniesCursor */
+export interface ListCompaniesCursor {
+  /** Aftername */
+  afterName: string;
+  /**
+   * Afterid
+   * @format uuid
+   */
+  afterId: string;
+}
+
 /** ListCompaniesResponse */
 export interface ListCompaniesResponse {
   /** Companies */
   companies: CompanyListItem[];
+  nextCursor?: ListCompaniesCursor | null;
 }
 
 /** UpdateCompanyRequest */
@@ -120,12 +138,30 @@ export interface ValidationError {
 
 export type CheckHealthData = HealthResponse;
 
+export interface ListCompaniesParams {
+  /**
+   * Limit
+   * @min 1
+   * @max 500
+   * @default 50
+   */
+  limit?: number;
+  /** Aftername */
+  afterName?: string | null;
+  /** Afterid */
+  afterId?: string | null;
+}
+
 export type ListCompaniesData = ListCompaniesResponse;
 
+export type ListCompaniesError = HTTPValidationError;
+
 export type CreateCompanyData = UpsertCompanyResponse;
 
 export type CreateCompanyError = HTTPValidationError;
 
+export type ExportCompaniesData = any;
+
 export interface GetCompanyParams {
   /**
    * Company Id
@@ -161,3 +197,7 @@ export interface DeleteCompanyParams {
 export type DeleteCompanyData = any;
 
 export type DeleteCompanyError = HTTPValidationError;
+
+export type BulkCreateCompaniesData = BulkCreateCompaniesResponse;
+
+export type BulkCreateCompaniesError = HTTPValidationError;
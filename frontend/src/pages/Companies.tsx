@@ -2,7 +2,7 @@
 import React, { useState, useEffect, useCallback } from "react"; // Added useCallback
 import { useNavigate } from "react-router-dom";
 import brain from "brain";
-import { Company } from "types"; // Assuming types are generated correctly
+import { Company, ListCompaniesCursor } from "types"; // Assuming types are generated correctly
 
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
@@ -23,10 +23,21 @@ const CompaniesPage: React.FC = () => {
       setError(null);
       try {
         console.log("Fetching companies...");
-        const response = await brain.list_companies();
-        const data = await response.json();
-        console.log("Companies data received:", data);
-        setCompanies(data.companies || []);
+        // The endpoint is paginated; follow nextCursor until every page is loaded
+        const allCompanies: Company[] = [];
+        let cursor: ListCompaniesCursor | null | undefined = null;
+        do {
+          const response = await brain.list_companies({
+            limit: 500,
+            afterName: cursor?.afterName,
+            afterId: cursor?.afterId,
+          });
+          const data = await response.json();
+          allCompanies.push(...(data.companies || []));
+          cursor = data.nextCursor;
+        } while (cursor);
+        console.log("Companies data received:", allCompanies.length);
+        setCompanies(allCompanies);
       } catch (err) {
         console.error("Error fetching companies:", err);
         setError("Failed to load companies. Please try again later.");